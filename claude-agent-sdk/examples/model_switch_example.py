@@ -19,12 +19,36 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'python-sdk'))
 
 try:
-    from claude_code_sdk import ClaudeSDKClient, ClaudeCodeOptions
+    from claude_code_sdk import (
+        ClaudeSDKClient,
+        ClaudeCodeOptions,
+        AssistantMessage,
+        ResultMessage,
+        TextBlock,
+    )
 except ImportError:
     print("❌ 无法导入Claude Code SDK")
     print("请确保Python SDK已正确安装")
     sys.exit(1)
 
+async def drain_response(client, label, show_model=False):
+    """接收一轮完整响应：打印文本内容，收到 ResultMessage 时结束
+
+    用 isinstance 按消息类型分发，避免逐条消息做 hasattr 探测；
+    并且只在真正的终止消息（ResultMessage）上退出循环，
+    防止中间消息携带 subtype 导致提前 break。
+    """
+    async for message in client.receive_response():
+        if isinstance(message, AssistantMessage):
+            for block in message.content:
+                if isinstance(block, TextBlock):
+                    print(f"🤖 {label}响应: {block.text}")
+            if show_model and getattr(message, 'model', None):
+                print(f"📋 消息中的模型字段: {message.model}")
+        elif isinstance(message, ResultMessage):
+            print(f"✅ {label}结果: {message.subtype}")
+            break
+
 async def test_model_switching():
     """测试模型切换功能的完整流程"""
     
@@ -55,70 +79,36 @@ async def test_model_switching():
         await client.query("/model opus")
         
         # 接收切换响应
-        async for message in client.receive_response():
-            if hasattr(message, 'content') and message.content:
-                if hasattr(message.content[0], 'text'):
-                    print(f"🤖 切换响应: {message.content[0].text}")
-            if hasattr(message, 'subtype') and message.subtype:
-                print(f"✅ 切换结果: {message.subtype}")
-                break
-        
+        await drain_response(client, "切换")
+
         # 3. 询问模型ID
         print("\n❓ 3. 询问当前模型ID")
         await client.query("What is your exact model ID? Please be specific about which Claude model you are.")
-        
+
         # 接收模型ID响应
-        async for message in client.receive_response():
-            if hasattr(message, 'content') and message.content:
-                if hasattr(message.content[0], 'text'):
-                    print(f"🤖 模型ID响应: {message.content[0].text}")
-            if hasattr(message, 'model'):
-                print(f"📋 消息中的模型字段: {message.model}")
-            if hasattr(message, 'subtype') and message.subtype:
-                print(f"✅ 查询结果: {message.subtype}")
-                break
-        
+        await drain_response(client, "模型ID查询", show_model=True)
+
         # 4. 发送错误命令 (故意打错)
         print("\n❌ 4. 发送错误命令: /modle sonnet (故意打错)")
         await client.query("/modle sonnet")
-        
+
         # 接收错误命令响应
-        async for message in client.receive_response():
-            if hasattr(message, 'content') and message.content:
-                if hasattr(message.content[0], 'text'):
-                    print(f"⚠️ 错误命令响应: {message.content[0].text}")
-            if hasattr(message, 'subtype') and message.subtype:
-                print(f"❌ 错误命令结果: {message.subtype}")
-                break
-        
+        await drain_response(client, "错误命令")
+
         # 5. 发送正确命令
         print("\n📝 5. 发送正确命令: /model sonnet")
         await client.query("/model sonnet")
-        
+
         # 接收正确切换响应
-        async for message in client.receive_response():
-            if hasattr(message, 'content') and message.content:
-                if hasattr(message.content[0], 'text'):
-                    print(f"🤖 正确切换响应: {message.content[0].text}")
-            if hasattr(message, 'subtype') and message.subtype:
-                print(f"✅ 正确切换结果: {message.subtype}")
-                break
-        
+        await drain_response(client, "正确切换")
+
         # 6. 再次询问模型ID
         print("\n❓ 6. 再次询问模型ID")
         await client.query("What is your model ID now? Have you switched back to Sonnet?")
-        
+
         # 接收最终模型ID响应
-        async for message in client.receive_response():
-            if hasattr(message, 'content') and message.content:
-                if hasattr(message.content[0], 'text'):
-                    print(f"🤖 最终模型ID响应: {message.content[0].text}")
-            if hasattr(message, 'model'):
-                print(f"📋 最终消息中的模型字段: {message.model}")
-            if hasattr(message, 'subtype') and message.subtype:
-                print(f"✅ 最终查询结果: {message.subtype}")
-                break
-        
+        await drain_response(client, "最终模型ID查询", show_model=True)
+
         print("\n🎉 模型切换测试完成!")
         print("=" * 50)
 
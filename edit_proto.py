@@ -2,8 +2,9 @@
 # -*- coding: utf-8 -*-
 """Script to edit proto file to add ModelInfoProto"""
 
-with open('ai-agent-proto/src/main/proto/ai_agent_rpc.proto', 'r', encoding='utf-8') as f:
-    content = f.read()
+import mmap
+
+PROTO_PATH = 'ai-agent-proto/src/main/proto/ai_agent_rpc.proto'
 
 old_text = '  bool default_chrome_enabled = 12;      // 默认启用 Chrome 扩展\n}\n\n// 思考级别配置'
 
@@ -21,10 +22,27 @@ message ModelInfoProto {
 
 // 思考级别配置'''
 
-if old_text in content:
-    content = content.replace(old_text, new_text)
-    with open('ai-agent-proto/src/main/proto/ai_agent_rpc.proto', 'w', encoding='utf-8') as f:
-        f.write(content)
-    print('✅ Proto file updated successfully!')
-else:
-    print('⚠️ Target text not found in proto file')
+old_bytes = old_text.encode('utf-8')
+new_bytes = new_text.encode('utf-8')
+
+with open(PROTO_PATH, 'r+b') as f:
+    mm = mmap.mmap(f.fileno(), 0)
+    idx = mm.find(old_bytes)
+    if idx < 0:
+        mm.close()
+        print('⚠️ Target text not found in proto file')
+    elif len(new_bytes) == len(old_bytes):
+        # 等长替换：直接在映射上原地写入，不重写整个文件
+        mm[idx:idx + len(new_bytes)] = new_bytes
+        mm.flush()
+        mm.close()
+        print('✅ Proto file updated successfully!')
+    else:
+        # 长度不同：先保留替换点之后的尾部，再从替换点开始写回
+        tail = bytes(mm[idx + len(old_bytes):])
+        mm.close()
+        f.seek(idx)
+        f.write(new_bytes)
+        f.write(tail)
+        f.truncate()
+        print('✅ Proto file updated successfully!')